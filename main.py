@@ -1,6 +1,32 @@
 from mips_pipline.ComprehensivePipelineProcessor import ComprehensivePipelineProcessor
 from mips_pipline.SimulationReportGenerator import SimulationReportGenerator
 
+# Test program with comprehensive instruction set, built once at module
+# scope as an immutable tuple
+SAMPLE_PROGRAM = (
+    # Arithmetic operations
+    0x00430820,  # add  r1, r2, r3       # R1 = R2 + R3
+    0x00A62022,  # sub  r4, r5, r6       # R4 = R5 - R6
+    0x20070005,  # addi r7, r0, 5        # R7 = R0 + 5
+
+    # Logical operations
+    0x00C84024,  # and  r8, r6, r8       # R8 = R6 & R8
+    0x00E94825,  # or   r9, r7, r9       # R9 = R7 | R9
+    0x00065080,  # sll  r10, r6, 2       # R10 = R6 << 2
+    0x000B5842,  # srl  r11, r11, 1      # R11 = R11 >> 1
+
+    # Memory operations
+    0x8C0C0000,  # lw   r12, 0(r0)      # R12 = MEM[R0 + 0]
+    0xAC0D0004,  # sw   r13, 4(r0)      # MEM[R0 + 4] = R13
+
+    # Branch and jump operations
+    0x10A60002,  # beq  r5, r6, 2        # if(R5==R6) PC+=8
+    0x00430820,  # add  r1, r2, r3       # (might be skipped)
+    0x14A60002,  # bne  r5, r6, 2        # if(R5!=R6) PC+=8
+    0x00C84024,  # and  r8, r6, r8       # (might be skipped)
+    0x08000000,  # j    0                # jump to address 0
+)
+
 def main():
     # Create processor instance with default configuration
     processor = ComprehensivePipelineProcessor(
@@ -9,31 +35,6 @@ def main():
         issue_width=2
     )
 
-    # Test program with comprehensive instruction set
-    program = [
-        # Arithmetic operations
-        0x00430820,  # add  r1, r2, r3       # R1 = R2 + R3
-        0x00A62022,  # sub  r4, r5, r6       # R4 = R5 - R6
-        0x20070005,  # addi r7, r0, 5        # R7 = R0 + 5
-        
-        # Logical operations
-        0x00C84024,  # and  r8, r6, r8       # R8 = R6 & R8
-        0x00E94825,  # or   r9, r7, r9       # R9 = R7 | R9
-        0x00065080,  # sll  r10, r6, 2       # R10 = R6 << 2
-        0x000B5842,  # srl  r11, r11, 1      # R11 = R11 >> 1
-        
-        # Memory operations
-        0x8C0C0000,  # lw   r12, 0(r0)      # R12 = MEM[R0 + 0]
-        0xAC0D0004,  # sw   r13, 4(r0)      # MEM[R0 + 4] = R13
-        
-        # Branch and jump operations
-        0x10A60002,  # beq  r5, r6, 2        # if(R5==R6) PC+=8
-        0x00430820,  # add  r1, r2, r3       # (might be skipped)
-        0x14A60002,  # bne  r5, r6, 2        # if(R5!=R6) PC+=8
-        0x00C84024,  # and  r8, r6, r8       # (might be skipped)
-        0x08000000,  # j    0                # jump to address 0
-    ]
-
     # Initialize registers with test values
     initial_registers = {
         2: 10,       # R2 = 10
@@ -57,7 +58,7 @@ def main():
     
     # Create report generator and run simulation
     report_generator = SimulationReportGenerator()
-    processor.simulate(program, max_cycles=50, report_generator=report_generator)
+    processor.simulate(SAMPLE_PROGRAM, max_cycles=50, report_generator=report_generator)
     
     # Generate PDF report
     report_generator.generate_pdf('simulation_report.pdf')
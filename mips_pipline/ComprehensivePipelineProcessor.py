@@ -1,8 +1,9 @@
 import logging
-from typing import List, Dict, Optional
+from array import array
+from typing import List, Dict, Optional, Sequence
 from mips_pipline.PipelineStage import PipelineStage
-from mips_pipline.InstructionDecoder import InstructionDecoder
-from mips_pipline.enums.ProcessorSignals import Stages, InstructionTypes, RegisterTypes, Instruction
+from mips_pipline.InstructionDecoder import DecodedInstruction, decode
+from mips_pipline.enums.ProcessorSignals import Stages, InstructionTypes, RegisterTypes, Instruction, Op, OP_BY_MNEMONIC
 
 # Configure logging
 logging.basicConfig(
@@ -12,6 +13,199 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Programs re-execute the same few instruction words in tight loops, so
+# their hex renderings are memoized instead of re-formatted every cycle
+_HEX_CACHE: Dict[int, str] = {}
+
+
+def hx(value: int) -> str:
+    cached = _HEX_CACHE.get(value)
+    if cached is None:
+        cached = _HEX_CACHE[value] = hex(value)
+    return cached
+
+
+# Hot-loop key constants: enum .value is a descriptor read in CPython, so
+# the stage and field keys used inside the per-cycle loops are bound once
+# here and loaded as plain module globals
+_IF = Stages.IF.value
+_ID = Stages.ID.value
+_EX = Stages.EX.value
+_MEM = Stages.MEM.value
+_WB = Stages.WB.value
+_EX_MEM = Stages.EX_MEM.value
+_MEM_WB = Stages.MEM_WB.value
+_PC_KEY = RegisterTypes.program_counter.value
+_RAW_KEY = RegisterTypes.raw_instruction.value
+_DECODED_INSTRUCTION = RegisterTypes.decoded_instruction.value
+_DECODED = RegisterTypes.decoded.value
+_ALU_RESULT = RegisterTypes.alu_result.value
+_MEM_RESULT = RegisterTypes.mem_result.value
+_BRANCH_TAKEN = RegisterTypes.branch_taken.value
+_JUMP_ADDRESS = RegisterTypes.jump_address.value
+_RD_KEY = RegisterTypes.rd.value
+
+# 32-bit word mask: every ALU result is truncated to this width so register
+# values stay in the machine's word size (and inside CPython's small-int
+# fast path) instead of growing into arbitrary-precision PyLongs
+M32 = 0xFFFFFFFF
+
+
+def to_signed(value: int) -> int:
+    """Reinterpret a masked 32-bit value as a signed integer."""
+    return ((value & M32) ^ 0x80000000) - 0x80000000
+
+
+# ALU dispatch tables: a single dict lookup replaces the per-mnemonic if/elif
+# chain in execute_stage. All callables share the signature (rs_val, rt_val,
+# shamt, imm) so any instruction can be executed through the same call site.
+R_OPS = {
+    Instruction.ADD.value: lambda a, b, s, i: (a + b) & M32,
+    Instruction.SUB.value: lambda a, b, s, i: (a - b) & M32,
+    Instruction.AND.value: lambda a, b, s, i: a & b & M32,
+    Instruction.OR.value: lambda a, b, s, i: (a | b) & M32,
+    Instruction.NOR.value: lambda a, b, s, i: ~(a | b) & M32,
+    Instruction.XOR.value: lambda a, b, s, i: (a ^ b) & M32,
+    Instruction.SLT.value: lambda a, b, s, i: 1 if to_signed(a) < to_signed(b) else 0,
+    Instruction.SGT.value: lambda a, b, s, i: 1 if to_signed(a) > to_signed(b) else 0,
+    Instruction.SLL.value: lambda a, b, s, i: (b << s) & M32,
+    Instruction.SRL.value: lambda a, b, s, i: (b & M32) >> s,
+}
+
+I_OPS = {
+    Instruction.ADDI.value: lambda a, b, s, i: (a + i) & M32,
+    Instruction.ORI.value: lambda a, b, s, i: (a | (i & 0xFFFF)) & M32,
+    Instruction.XORI.value: lambda a, b, s, i: (a ^ (i & 0xFFFF)) & M32,
+    Instruction.LW.value: lambda a, b, s, i: (a + i) & M32,
+    Instruction.SW.value: lambda a, b, s, i: (a + i) & M32,
+}
+
+# Branch condition table: callables return whether the branch is taken.
+# Relative comparisons go through to_signed since registers hold the
+# unsigned 32-bit representation.
+BRANCH_OPS = {
+    Instruction.BEQ.value: lambda a, b: a == b,
+    Instruction.BNE.value: lambda a, b: a != b,
+    Instruction.BLTZ.value: lambda a, b: to_signed(a) < 0,
+    Instruction.BGEZ.value: lambda a, b: to_signed(a) >= 0,
+}
+
+# Merged view so execute_stage resolves any ALU op without re-checking the
+# instruction type (mnemonics are unique across formats).
+ALU_OPS = {**R_OPS, **I_OPS}
+
+# Direct-threaded execute handlers: each decoded instruction is bound to its
+# handler once when the program is loaded, so execute_stage performs a single
+# indirect call per instruction with no mnemonic dispatch at all. Handlers
+# return (alu_result, branch_taken, jump_address).
+
+# Shared result tuple for every handler outcome that carries no data:
+# not-taken branches and NOPs account for most non-ALU executions, so
+# reusing one tuple avoids an allocation per instruction per cycle
+_NO_EFFECT = (None, False, None)
+
+
+def _exec_alu(op):
+    def execute(proc, decoded, rs_val, rt_val):
+        return op(rs_val, rt_val, decoded.shamt, decoded.immediate), False, None
+    return execute
+
+
+def _exec_branch(condition):
+    def execute(proc, decoded, rs_val, rt_val):
+        if condition(rs_val, rt_val):
+            return None, True, proc.pc + decoded.immediate
+        return _NO_EFFECT
+    return execute
+
+
+def _exec_jump(proc, decoded, rs_val, rt_val):
+    return None, True, decoded.address
+
+
+def _exec_jump_and_link(proc, decoded, rs_val, rt_val):
+    proc.registers[31] = proc.pc
+    return None, True, decoded.address
+
+
+def _exec_nop(proc, decoded, rs_val, rt_val):
+    return _NO_EFFECT
+
+
+def _exec_illegal(proc, decoded, rs_val, rt_val):
+    """Trap handler for undecodable words.
+
+    Installed in the dispatch table at the UNKNOWN slot, so illegal
+    instructions flow through the same indirect call as every other op —
+    no per-cycle validity check anywhere on the critical path. The fault
+    is counted and logged; the slot retires with no architectural effect.
+    """
+    proc.illegal_instruction_count += 1
+    logger.warning("Illegal instruction trapped in EX (opcode 0x%02x, funct 0x%02x)",
+                   decoded.opcode, decoded.funct)
+    return _NO_EFFECT
+
+
+EXECUTE_HANDLERS = {mnemonic: _exec_alu(op) for mnemonic, op in ALU_OPS.items()}
+EXECUTE_HANDLERS.update(
+    {mnemonic: _exec_branch(condition) for mnemonic, condition in BRANCH_OPS.items()})
+EXECUTE_HANDLERS[Instruction.J.value] = _exec_jump
+EXECUTE_HANDLERS[Instruction.JAL.value] = _exec_jump_and_link
+
+# The same handlers as a list indexed by integer op id: binding at program
+# load becomes a plain list index on decoded.op, with _exec_nop filling every
+# unhandled slot so no .get fallback is needed
+EXECUTE_BY_OP = [_exec_nop] * len(Op)
+for _mnemonic, _handler in EXECUTE_HANDLERS.items():
+    EXECUTE_BY_OP[OP_BY_MNEMONIC[_mnemonic]] = _handler
+EXECUTE_BY_OP[Op.UNKNOWN] = _exec_illegal
+
+# Branch conditions by op id, used to specialize branch handlers per record
+# at program load
+BRANCH_CONDITIONS_BY_OP = {
+    OP_BY_MNEMONIC[mnemonic]: condition for mnemonic, condition in BRANCH_OPS.items()
+}
+
+# Branch classification packed into one int, bit op-id set for conditional
+# branches: "is this a branch?" is a shift-and-mask on a single word instead
+# of a table load, and the whole class fits in one machine register
+_BRANCH_OPS_MASK = 0
+for _op in BRANCH_CONDITIONS_BY_OP:
+    _BRANCH_OPS_MASK |= 1 << _op
+
+# The Op members tested inside the MEM/WB inner loops, bound as plain ints:
+# a module global load beats the enum class attribute walk per slot
+_OP_LW = int(Op.LW)
+_OP_SW = int(Op.SW)
+_OP_JAL = int(Op.JAL)
+
+# Branch history table geometry: 1024 two-bit saturating counters
+_BHT_SIZE = 1024
+_BHT_MASK = _BHT_SIZE - 1
+
+
+def _bind_branch(condition, immediate):
+    """Branch handler with the condition and immediate frozen in as locals.
+
+    The target offset is fixed at decode time, so only the dynamic fetch PC
+    is read per execution; the record's field loads drop out of the hot path.
+    """
+    def execute(proc, decoded, rs_val, rt_val):
+        if condition(rs_val, rt_val):
+            return None, True, proc.pc + immediate
+        return _NO_EFFECT
+    return execute
+
+# Write-back classification sets, hoisted to module level so the WB stage
+# does O(1) membership checks on integer op ids instead of rebuilding a
+# mnemonic list per instruction
+WB_RD_OPS = frozenset(OP_BY_MNEMONIC[mnemonic] for mnemonic in R_OPS)
+WB_RT_OPS = frozenset((Op.ADDI, Op.ORI, Op.XORI))
+
+# Flat views of the sets above for the WB inner loop: indexing a list by
+# the op id skips even the set's hash-and-probe
+_WRITES_RD = [op in WB_RD_OPS for op in range(len(Op))]
+_WRITES_RT = [op in WB_RT_OPS for op in range(len(Op))]
 class ComprehensivePipelineProcessor:
     """
     A superscalar MIPS pipeline processor implementation supporting multiple instruction issue.
@@ -28,32 +222,80 @@ class ComprehensivePipelineProcessor:
             register_count: Number of general-purpose registers
             issue_width: Number of instructions that can be issued per cycle
         """
-        # Initialize processor components
-        self.memory = [0] * memory_size
-        self.registers = [0] * register_count
+        # Initialize processor components. array.array stores the words
+        # unboxed and contiguous instead of as a list of PyLong objects;
+        # 'q' (signed 64-bit) leaves headroom for unmasked arithmetic results.
+        self.memory = array('q', [0] * memory_size)
+        self.registers = array('q', [0] * register_count)
         self.issue_width = issue_width
 
-        # Initialize pipeline stages
+        # Initialize pipeline stages. The per-cycle code reaches each stage
+        # through these direct references (one attribute load); the labeled
+        # dict below is the same objects, kept for reports and logging.
+        self._if_stage = PipelineStage('Instruction Fetch', self.issue_width)
+        self._id_stage = PipelineStage('Instruction Decode', self.issue_width)
+        self._ex_stage = PipelineStage('Execute', self.issue_width)
+        self._mem_stage = PipelineStage('Memory Access', self.issue_width)
+        self._wb_stage = PipelineStage('Write Back', self.issue_width)
         self.stages = {
-            Stages.IF.value: PipelineStage('Instruction Fetch', self.issue_width),
-            Stages.ID.value: PipelineStage('Instruction Decode', self.issue_width),
-            Stages.EX.value: PipelineStage('Execute', self.issue_width),
-            Stages.MEM.value: PipelineStage('Memory Access', self.issue_width),
-            Stages.WB.value: PipelineStage('Write Back', self.issue_width)
+            _IF: self._if_stage,
+            _ID: self._id_stage,
+            _EX: self._ex_stage,
+            _MEM: self._mem_stage,
+            _WB: self._wb_stage
         }
 
         # Processor state
         self.pc = 0
         self.cycle_count = 0
         self.instruction_count = 0
-        self.program: List[int] = []
+        # Count of fetched instructions that have not reached execute yet;
+        # lets simulate() test front-end occupancy with one integer compare
+        # instead of scanning every stage's slots each cycle
+        self.active_instructions = 0
+        self.program: Sequence[int] = ()
+        self.decoded_program: List[DecodedInstruction] = []
+        # Per-PC fetch detail dicts, precomputed in simulate(): their contents
+        # (PC, raw hex, decoded record) are fixed per program word, so the
+        # front end hands out references instead of building dicts each cycle
+        self.fetch_details_by_pc: List[Dict] = []
 
         # Hazard handling
         self.forwarding = {
-            Stages.EX_MEM.value: [None] * self.issue_width,
-            Stages.MEM_WB.value: [None] * self.issue_width
+            _EX_MEM: [None] * self.issue_width,
+            _MEM_WB: [None] * self.issue_width
         }
         self.stall = False
+        # Register -> forwarded value, rebuilt whenever the forwarding slots
+        # rotate so register reads are a single dict lookup
+        self.forwarding_by_reg: Dict[int, int] = {}
+        # Branch predictor: 2-bit saturating counters indexed by branch PC,
+        # initialized weakly-not-taken. The front end fetches sequentially
+        # (a structural not-taken prediction), so the table currently feeds
+        # the hit/miss accounting below rather than redirecting fetch.
+        self.branch_predictor = array('b', [1] * _BHT_SIZE)
+        self.branch_hits = 0
+        self.branch_misses = 0
+        # Bumped by the illegal-instruction trap handler
+        self.illegal_instruction_count = 0
+
+        # Destination-register bitmask of instructions currently in EX/MEM,
+        # rebuilt once per cycle so hazard detection is a few integer ANDs
+        self.in_flight_dst_mask = 0
+
+        # Reusable per-cycle slot buffers: the stages overwrite these by
+        # index each cycle instead of allocating fresh result lists
+        self._decoded_buf: List[Optional[DecodedInstruction]] = [None] * issue_width
+        # Partial evaluation for the default configuration: dual issue gets
+        # the hand-unrolled cycle method, other widths the generic loop
+        if issue_width == 2:
+            self.run_pipeline_cycle = self._run_pipeline_cycle_w2
+        self._ex_input: List[Optional[DecodedInstruction]] = [None] * issue_width
+        # PC of each EX-input slot, tracked alongside the records (which are
+        # shared between PCs) so the branch predictor can index by branch PC
+        self._ex_input_pcs: List[Optional[int]] = [None] * issue_width
+        self._ex_results: List[Optional[Dict]] = [None] * issue_width
+        self._mem_results: List[Optional[Dict]] = [None] * issue_width
 
     def set_registers(self, initial_values: Dict[int, int]):
         for reg, value in initial_values.items():
@@ -63,294 +305,503 @@ class ComprehensivePipelineProcessor:
     def fetch_stage(self) -> List[Optional[int]]:
         """
         Fetch stage: Retrieves instructions from program memory based on PC.
-        Returns a list of fetched instructions (or None for empty slots).
+        Pushes references into the pre-decoded program cache so later stages
+        never re-decode. Returns a list of fetched instructions (or None for empty slots).
         """
-        stage = self.stages[Stages.IF.value]
-        instructions = []
-        
-        # Fetch multiple instructions based on issue width
-        for _ in range(self.issue_width):
-            if self.pc < len(self.program):
-                instructions.append(self.program[self.pc])
-                self.pc += 1
-            else:
-                instructions.append(None)
-                
-        # Update stage information
-        stage.instructions = instructions
-        stage.details = [
-            {RegisterTypes.program_counter.value: self.pc - len(instructions) + i,
-             RegisterTypes.raw_instruction.value: hex(instr)}
-            if instr is not None else {} for i, instr in enumerate(instructions)
-        ]
-        
-        logger.info(f"Fetch Stage - Instructions: {[hex(instr) if instr is not None else 'None' for instr in instructions]}")
+        stage = self._if_stage
+        instructions = stage.instructions
+        details = stage.details
+
+        # Hoist the hot attribute/length lookups out of the fetch loop
+        pc = self.pc
+        issue_width = self.issue_width
+
+        # Take the whole issue bundle as one slice copy into the stage's slot
+        # buffers instead of a per-slot Python loop, padding the tail with
+        # empty slots at end of program
+        end = pc + issue_width
+        program_len = len(self.program)
+        if end > program_len:
+            end = program_len
+        count = end - pc
+        instructions[:count] = self.program[pc:end]
+        details[:count] = self.fetch_details_by_pc[pc:end]
+        for slot in range(count, issue_width):
+            instructions[slot] = None
+            details[slot] = None
+        self.pc = end
+        self.active_instructions += count
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Fetch Stage - Instructions: %s",
+                        [hx(instr) if instr is not None else 'None' for instr in instructions])
         return instructions
 
-    def decode_stage(self, instructions: List[Optional[int]]) -> List[Optional[Dict]]:
-        stage = self.stages[Stages.ID.value]
-        decoded_instructions = [
-            InstructionDecoder.decode(instr) if instr is not None else None for instr in instructions
-        ]
-        stage.instructions = [
-            decoded[RegisterTypes.mnemonic.value] if decoded else None 
-            for decoded in decoded_instructions
-        ]
-        stage.details = [{RegisterTypes.decoded_instruction.value: decoded} if decoded else {} for decoded in decoded_instructions]
+    def decode_stage(self, fetch_details: List[Dict]) -> List[Optional[DecodedInstruction]]:
+        stage = self._id_stage
+        decoded_instructions = self._decoded_buf
+        instructions = stage.instructions
+        details = stage.details
+        for slot, detail in enumerate(fetch_details):
+            decoded = detail.get(_DECODED_INSTRUCTION) if detail else None
+            decoded_instructions[slot] = decoded
+            if decoded:
+                instructions[slot] = decoded.mnemonic
+                # The precomputed fetch detail already carries the decoded
+                # record under the key ID consumers read, so it is forwarded
+                # as-is (the dicts are never mutated downstream)
+                details[slot] = detail
+            else:
+                instructions[slot] = None
+                details[slot] = None
         return decoded_instructions
 
-    def execute_stage(self, decoded_instructions: List[Optional[Dict]]) -> List[Optional[Dict]]:
+    def execute_stage(self, decoded_instructions: List[Optional[DecodedInstruction]]) -> List[Optional[Dict]]:
         """
         Execute stage: Performs arithmetic, logical, and control operations.
         Handles R-type, I-type, and J-type instructions with appropriate ALU operations.
         """
-        stage = self.stages[Stages.EX.value]
-        results = []
+        stage = self._ex_stage
+        results = self._ex_results
+
+        # All-bubble bundle (flush/stall aftermath): clear the stage and
+        # skip the per-slot execution machinery
+        if not any(decoded_instructions):
+            instructions = stage.instructions
+            details = stage.details
+            for slot in range(self.issue_width):
+                results[slot] = None
+                instructions[slot] = None
+                details[slot] = None
+            return results
+
         branch_taken = False
         jump_address = None
 
+        # Bind the forwarding dict and register file to locals: operand reads
+        # happen twice per instruction, and the inlined lookup avoids a
+        # method call per read
+        fwd = self.forwarding_by_reg
+        regs = self.registers
+        # Hoist the per-slot module globals too: LOAD_FAST inside the loop
+        # instead of a LOAD_GLOBAL per reference
+        branch_mask = _BRANCH_OPS_MASK
+        bht_mask = _BHT_MASK
+        ex_input_pcs = self._ex_input_pcs
+
         # Process each instruction in parallel
-        for decoded in decoded_instructions:
+        for slot, decoded in enumerate(decoded_instructions):
             if decoded is None:
-                results.append(None)
+                results[slot] = None
                 continue
-
-            # Extract instruction components
-            instr_type = decoded[RegisterTypes.type.value]
-            mnemonic = decoded[RegisterTypes.mnemonic.value]
-            rs_val = self.get_register_value(decoded[RegisterTypes.rs.value])
-            rt_val = self.get_register_value(decoded[RegisterTypes.rt.value])
-            rd = decoded.get(RegisterTypes.rd.value, None)
-            shamt = decoded.get(RegisterTypes.shamt.value, 0)
-            imm = decoded[RegisterTypes.immediate.value]
-            address = decoded.get(RegisterTypes.address.value, None)
-
-            result = None
-
-            # Execute based on instruction type
-            if instr_type == InstructionTypes.R.value:
-                if mnemonic == Instruction.ADD.value: result = rs_val + rt_val
-                elif mnemonic == Instruction.SUB.value: result = rs_val - rt_val
-                elif mnemonic == Instruction.AND.value: result = rs_val & rt_val
-                elif mnemonic == Instruction.OR.value: result = rs_val | rt_val
-                elif mnemonic == Instruction.NOR.value: result = ~(rs_val | rt_val) & 0xFFFFFFFF
-                elif mnemonic == Instruction.XOR.value: result = rs_val ^ rt_val
-                elif mnemonic == Instruction.SLT.value: result = 1 if rs_val < rt_val else 0
-                elif mnemonic == Instruction.SGT.value: result = 1 if rs_val > rt_val else 0
-                elif mnemonic == Instruction.SLL.value: result = rt_val << shamt
-                elif mnemonic == Instruction.SRL.value: result = (rt_val & 0xFFFFFFFF) >> shamt
-            elif instr_type == InstructionTypes.I.value:
-                if mnemonic == Instruction.ADDI.value: result = rs_val + imm
-                elif mnemonic == Instruction.ORI.value: result = rs_val | (imm & 0xFFFF)
-                elif mnemonic == Instruction.XORI.value: result = rs_val ^ (imm & 0xFFFF)
-                elif mnemonic in [Instruction.LW.value, Instruction.SW.value]: result = rs_val + imm
-                elif mnemonic == Instruction.BEQ.value and rs_val == rt_val:
-                    branch_taken = True
-                    jump_address = self.pc + imm
-                elif mnemonic == Instruction.BNE.value and rs_val != rt_val:
-                    branch_taken = True
-                    jump_address = self.pc + imm
-                elif mnemonic == Instruction.BLTZ.value and rs_val < 0:
-                    branch_taken = True
-                    jump_address = self.pc + imm
-                elif mnemonic == Instruction.BGEZ.value and rs_val >= 0:
-                    branch_taken = True
-                    jump_address = self.pc + imm
-            elif instr_type == InstructionTypes.J.value:
-                if mnemonic == InstructionTypes.J.value:
-                    jump_address = address
-                    branch_taken = True
-                elif mnemonic == Instruction.JAL.value:
-                    self.registers[31] = self.pc
-                    jump_address = address
-                    branch_taken = True
+            # Leaving the front end: results now drain through EX/MEM/WB
+            self.active_instructions -= 1
+
+            # Read operands and call the handler bound at program load. The
+            # membership test (rather than .get with a fallback) keeps a
+            # forwarded value of 0 from being shadowed by the register file.
+            rs = decoded.rs
+            rt = decoded.rt
+            rs_val = fwd[rs] if rs in fwd else regs[rs]
+            rt_val = fwd[rt] if rt in fwd else regs[rt]
+            handler = decoded.execute or _exec_nop
+            result, taken, target = handler(self, decoded, rs_val, rt_val)
+
+            # Resolve the predictor for conditional branches: score the
+            # 2-bit counter against the actual direction, then saturate it
+            # toward the outcome
+            if branch_mask >> decoded.op & 1:
+                branch_pc = ex_input_pcs[slot]
+                if branch_pc is not None:
+                    bht = self.branch_predictor
+                    idx = branch_pc & bht_mask
+                    counter = bht[idx]
+                    if (counter >= 2) == taken:
+                        self.branch_hits += 1
+                    else:
+                        self.branch_misses += 1
+                    if taken:
+                        if counter < 3:
+                            bht[idx] = counter + 1
+                    elif counter > 0:
+                        bht[idx] = counter - 1
+
+            if taken:
+                branch_taken = True
+                jump_address = target
 
             # Handle branch/jump outcomes
             if branch_taken and jump_address is not None:
                 self.pc = jump_address
                 self.flush_pipeline()
 
-            results.append({
-                RegisterTypes.alu_result.value: result,
-                RegisterTypes.decoded.value: decoded,
-                RegisterTypes.branch_taken.value: branch_taken,
-                RegisterTypes.jump_address.value: jump_address
-            })
-
-        # Update stage information
-        stage.instructions = [decoded[RegisterTypes.mnemonic.value] if decoded else None 
-                            for decoded in decoded_instructions]
-        stage.details = results
+            results[slot] = {
+                _ALU_RESULT: result,
+                _DECODED: decoded,
+                _BRANCH_TAKEN: branch_taken,
+                _JUMP_ADDRESS: jump_address
+            }
+
+        # Update stage information slot by slot; this runs after any mid-loop
+        # flush so the executed bundle still drains through MEM/WB
+        instructions = stage.instructions
+        details = stage.details
+        for slot, decoded in enumerate(decoded_instructions):
+            instructions[slot] = decoded.mnemonic if decoded else None
+            details[slot] = results[slot]
         return results
 
     def memory_stage_func(self, execute_data: List[Optional[Dict]]) -> List[Optional[Dict]]:
-        stage = self.stages[Stages.MEM.value]
-        mem_results = []
-        for data in execute_data:
-            if data is None or RegisterTypes.decoded.value not in data:
-                mem_results.append(None)
+        stage = self._mem_stage
+        mem_results = self._mem_results
+
+        # All-bubble input: nothing to access, just clear the stage slots
+        if not any(execute_data):
+            instructions = stage.instructions
+            details = stage.details
+            for slot in range(self.issue_width):
+                mem_results[slot] = None
+                instructions[slot] = None
+                details[slot] = None
+            return mem_results
+
+        # Bind the memory buffer and its bound once per bundle rather than
+        # per address check, and the op ids tested per slot as locals
+        memory = self.memory
+        memory_len = len(memory)
+        op_lw = _OP_LW
+        op_sw = _OP_SW
+        for slot, data in enumerate(execute_data):
+            if data is None or _DECODED not in data:
+                mem_results[slot] = None
                 continue
 
-            decoded = data[RegisterTypes.decoded.value]
-            if RegisterTypes.mnemonic.value not in decoded:
-                mem_results.append(None)
-                continue
-
-            alu_result = data.get(RegisterTypes.alu_result.value)
-            mnemonic = decoded[RegisterTypes.mnemonic.value]
+            decoded = data[_DECODED]
+            alu_result = data.get(_ALU_RESULT)
+            op = decoded.op
             mem_result = alu_result
 
-            if mnemonic == Instruction.LW.value and alu_result is not None and 0 <= alu_result < len(self.memory):
-                mem_result = self.memory[alu_result]
-            elif mnemonic == Instruction.SW.value and alu_result is not None and 0 <= alu_result < len(self.memory):
-                self.memory[alu_result] = self.registers[decoded[RegisterTypes.rt.value]]
-
-            mem_results.append({
-                RegisterTypes.mem_result.value: mem_result,
-                RegisterTypes.decoded.value: decoded,
-                RegisterTypes.alu_result.value: alu_result
-            })
-
-        stage.instructions = [
-            data[RegisterTypes.decoded.value][RegisterTypes.mnemonic.value] if data and RegisterTypes.decoded.value in data and RegisterTypes.mnemonic.value in data[RegisterTypes.decoded.value] else None
-            for data in execute_data
-        ]
-        stage.details = mem_results
+            if op == op_lw and alu_result is not None and 0 <= alu_result < memory_len:
+                mem_result = memory[alu_result]
+            elif op == op_sw and alu_result is not None and 0 <= alu_result < memory_len:
+                memory[alu_result] = self.registers[decoded.rt]
+
+            mem_results[slot] = {
+                _MEM_RESULT: mem_result,
+                _DECODED: decoded,
+                _ALU_RESULT: alu_result
+            }
+
+        instructions = stage.instructions
+        details = stage.details
+        for slot, data in enumerate(execute_data):
+            instructions[slot] = (
+                data[_DECODED].mnemonic
+                if data and _DECODED in data else None
+            )
+            details[slot] = mem_results[slot]
         return mem_results
 
     def write_back_stage_func(self, memory_data: List[Optional[Dict]]):
-        stage = self.stages[Stages.WB.value]
-
+        stage = self._wb_stage
+
+        # All-bubble input: no register writes, just clear the stage slots
+        if not any(memory_data):
+            instructions = stage.instructions
+            details = stage.details
+            for slot in range(self.issue_width):
+                instructions[slot] = None
+                details[slot] = None
+            return
+
+        # Hoist the register file and the classification globals read per
+        # retiring instruction into locals
+        registers = self.registers
+        writes_rd = _WRITES_RD
+        writes_rt = _WRITES_RT
+        op_lw = _OP_LW
+        op_jal = _OP_JAL
         for data in memory_data:
-            if data is None or RegisterTypes.decoded.value not in data or RegisterTypes.mnemonic.value not in data[RegisterTypes.decoded.value]:
+            if data is None or _DECODED not in data:
                 continue
 
-            decoded = data[RegisterTypes.decoded.value]
-            mnemonic = decoded[RegisterTypes.mnemonic.value]
-            alu_result = data.get(RegisterTypes.alu_result.value)
-            mem_result = data.get(RegisterTypes.mem_result.value)
-            rd = decoded.get(RegisterTypes.rd.value, None)
-            rt = decoded.get(RegisterTypes.rt.value, None)
-
-            if mnemonic in [Instruction.ADD.value, Instruction.SUB.value, Instruction.AND.value, Instruction.OR.value, Instruction.NOR.value, Instruction.XOR.value, Instruction.SLT.value, Instruction.SGT.value, Instruction.SLL.value, Instruction.SRL.value] and rd != 0 and alu_result is not None:
-                self.registers[rd] = alu_result
-            elif mnemonic in [Instruction.ADDI.value, Instruction.ORI.value, Instruction.XORI.value] and rt != 0 and alu_result is not None:
-                self.registers[rt] = alu_result
-            elif mnemonic == Instruction.LW.value and rt != 0 and mem_result is not None:
-                self.registers[rt] = mem_result
-            elif mnemonic == Instruction.JAL.value and data.get(RegisterTypes.jump_address.value) is not None:
-                self.registers[31] = self.pc
-
-        stage.instructions = [
-            data[RegisterTypes.decoded.value][RegisterTypes.mnemonic.value] if data and RegisterTypes.decoded.value in data and RegisterTypes.mnemonic.value in data[RegisterTypes.decoded.value] else None
-            for data in memory_data
-        ]
-        stage.details = memory_data if memory_data else [{}] * self.issue_width
+            decoded = data[_DECODED]
+            op = decoded.op
+            alu_result = data.get(_ALU_RESULT)
+            mem_result = data.get(_MEM_RESULT)
+            rd = decoded.rd
+            rt = decoded.rt
+
+            if writes_rd[op] and rd != 0 and alu_result is not None:
+                registers[rd] = alu_result
+            elif writes_rt[op] and rt != 0 and alu_result is not None:
+                registers[rt] = alu_result
+            elif op == op_lw and rt != 0 and mem_result is not None:
+                registers[rt] = mem_result
+            elif op == op_jal and data.get(_JUMP_ADDRESS) is not None:
+                registers[31] = self.pc
+
+        instructions = stage.instructions
+        details = stage.details
+        for slot, data in enumerate(memory_data):
+            instructions[slot] = (
+                data[_DECODED].mnemonic
+                if data and _DECODED in data else None
+            )
+            details[slot] = data
 
     def get_register_value(self, reg_num: int) -> int:
-        for fwd in self.forwarding[Stages.EX_MEM.value] + self.forwarding[Stages.MEM_WB.value]:
-            if fwd and RegisterTypes.rd.value in fwd and fwd[RegisterTypes.rd.value] == reg_num and reg_num != 0:
-                return fwd['value']
-        return self.registers[reg_num]
-
-    def detect_data_hazard(self, decoded_instructions: List[Optional[Dict]]) -> bool:
-        for i, decoded in enumerate(decoded_instructions):
+        # Two-step get: the register file is only read on a forwarding miss
+        # (or for entries that carry no result, which fall back to the
+        # architected value)
+        value = self.forwarding_by_reg.get(reg_num)
+        return self.registers[reg_num] if value is None else value
+
+    def detect_data_hazard(self, decoded_instructions: List[Optional[DecodedInstruction]]) -> bool:
+        # Walk the bundle youngest-first accumulating destination bits, so
+        # each instruction's source mask is tested against everything in
+        # EX/MEM plus the younger same-bundle writes with two integer ANDs
+        # ($0 is already dropped from every destination mask at decode)
+        hazard_dst_mask = self.in_flight_dst_mask
+        for decoded in reversed(decoded_instructions):
             if decoded is None:
                 continue
-            src_regs = self.get_source_registers(decoded)
-            for stage_name in [Stages.EX.value, Stages.MEM.value]:
-                for prev_instr in self.stages[stage_name].details:
-                    if prev_instr and RegisterTypes.decoded.value in prev_instr:
-                        prev_rd = prev_instr[RegisterTypes.decoded.value].get(RegisterTypes.rd.value) or prev_instr[RegisterTypes.decoded.value].get(RegisterTypes.rt.value)
-                        if prev_rd in src_regs and prev_rd != 0:
-                            return True
-            for j in range(i + 1, len(decoded_instructions)):
-                if decoded_instructions[j]:
-                    dst = decoded_instructions[j].get(RegisterTypes.rd.value) or decoded_instructions[j].get(RegisterTypes.rt.value)
-                    if dst in src_regs and dst != 0:
-                        return True
+            if decoded.src_mask & hazard_dst_mask:
+                return True
+            hazard_dst_mask |= decoded.dst_mask
         return False
 
-    def get_source_registers(self, decoded: dict) -> list:
-        instr_type = decoded[RegisterTypes.type.value]
-        mnemonic = decoded[RegisterTypes.mnemonic.value]
-        if instr_type == InstructionTypes.R.value:
-            return [decoded[RegisterTypes.rs.value], decoded[RegisterTypes.rt.value]]
-        elif instr_type == InstructionTypes.I.value:
-            src = [decoded[RegisterTypes.rs.value]]
-            if mnemonic in [Instruction.BEQ.value, Instruction.BNE.value, Instruction.SW.value]:
-                src.append(decoded[RegisterTypes.rt.value])
-            return src
-        return []
+    def get_source_registers(self, decoded: DecodedInstruction) -> list:
+        return list(decoded.src_regs)
 
     def flush_pipeline(self):
+        # Everything still in the front end is discarded with the stage buffers
+        self.active_instructions = 0
+        # Clear the existing slot buffers in place instead of allocating two
+        # fresh lists per stage on every taken branch; None is the single
+        # empty-slot marker, so a flush allocates nothing at all
         for stage in self.stages.values():
-            stage.instructions = [None] * self.issue_width
-            stage.details = [{}] * self.issue_width
+            instructions = stage.instructions
+            details = stage.details
+            for i in range(self.issue_width):
+                instructions[i] = None
+                details[i] = None
 
     def run_pipeline_cycle(self):
         self.cycle_count += 1
-        cycle_info = f"\n---- Cycle {self.cycle_count} ----"
-
-        self.write_back_stage_func(self.stages[Stages.MEM.value].details)
-        mem_data = self.memory_stage_func(self.stages[Stages.EX.value].details)
-        ex_data = self.execute_stage([d.get(RegisterTypes.decoded_instruction.value) if d else None for d in self.stages[Stages.ID.value].details])
-        decoded_instructions = self.decode_stage(self.stages[Stages.IF.value].instructions)
+        log_enabled = logger.isEnabledFor(logging.INFO)
+
+        # Alias the stage detail lists once per cycle; every use below is
+        # then a LOAD_FAST instead of two attribute loads and a dict index
+        stages = self.stages
+        ex_details = self._ex_stage.details
+        mem_details = self._mem_stage.details
+
+        self.write_back_stage_func(mem_details)
+        mem_data = self.memory_stage_func(ex_details)
+        # Fill the reusable EX input buffer in place rather than building a
+        # fresh list per cycle
+        ex_input = self._ex_input
+        ex_input_pcs = self._ex_input_pcs
+        for slot, d in enumerate(self._id_stage.details):
+            if d:
+                ex_input[slot] = d.get(_DECODED_INSTRUCTION)
+                ex_input_pcs[slot] = d.get(_PC_KEY)
+            else:
+                ex_input[slot] = None
+                ex_input_pcs[slot] = None
+        ex_data = self.execute_stage(ex_input)
+        decoded_instructions = self.decode_stage(self._if_stage.details)
+
+        # Collect in-flight destination bits from the freshly updated EX/MEM
+        # details so detect_data_hazard avoids the nested stage scan
+        in_flight_dst_mask = 0
+        for data in ex_details:
+            if data and _DECODED in data:
+                in_flight_dst_mask |= data[_DECODED].dst_mask
+        for data in mem_details:
+            if data and _DECODED in data:
+                in_flight_dst_mask |= data[_DECODED].dst_mask
+        self.in_flight_dst_mask = in_flight_dst_mask
 
         hazard = self.detect_data_hazard(decoded_instructions)
         if hazard:
-            logger.info(f"{cycle_info}\nData hazard detected. Stalling pipeline.")
+            if log_enabled:
+                logger.info("\n---- Cycle %d ----\nData hazard detected. Stalling pipeline.", self.cycle_count)
             self.flush_pipeline()
             stall_info = "STALL: Inserted bubble (NOP)"
-            fetched_instructions = [None] * self.issue_width  # Insert NOPs
+            # The flushed IF slots already read as NOPs; nothing is fetched
         else:
-            fetched_instructions = self.fetch_stage()
+            self.fetch_stage()
             stall_info = "NO STALL"
 
-        self.forwarding[Stages.MEM_WB.value] = self.forwarding[Stages.EX_MEM.value]
-        self.forwarding[Stages.EX_MEM.value] = [
+        self.forwarding[_MEM_WB] = self.forwarding[_EX_MEM]
+        self.forwarding[_EX_MEM] = [
             None if not data else {
-                RegisterTypes.rd.value: data[RegisterTypes.decoded.value].get(RegisterTypes.rd.value) or data[RegisterTypes.decoded.value].get(RegisterTypes.rt.value),
-                'value': data.get(RegisterTypes.alu_result.value)
-            } for data in self.stages[Stages.EX.value].details
+                _RD_KEY: data[_DECODED].rd or data[_DECODED].rt,
+                'value': data.get(_ALU_RESULT)
+            } for data in ex_details
         ]
+        # MEM_WB first so EX_MEM (the younger result) wins on overlap,
+        # matching the old scan order of the forwarding buffers
+        self.forwarding_by_reg = {
+            fwd[_RD_KEY]: fwd['value']
+            for fwd in self.forwarding[_MEM_WB] + self.forwarding[_EX_MEM]
+            if fwd and fwd[_RD_KEY]
+        }
+
+        # Skip all per-cycle string building when INFO output is filtered
+        if log_enabled:
+            pipeline_details = [
+                f"{name}: {', '.join([hx(instr) if isinstance(instr, int) else (instr if instr else Instruction.NOP.value) for instr in stage.instructions])}"
+                for name, stage in stages.items()
+            ]
+            logger.info("\n---- Cycle %d ----\n%s | %s", self.cycle_count, ' | '.join(pipeline_details), stall_info)
+            self.print_clock_cycle()
+
+    def _run_pipeline_cycle_w2(self):
+        """Issue-width-2 specialization of run_pipeline_cycle.
+
+        The default configuration is dual issue, so the per-lane loops are
+        unrolled into straight-line code for exactly two slots. Any change
+        to run_pipeline_cycle must be mirrored here.
+        """
+        self.cycle_count += 1
+        log_enabled = logger.isEnabledFor(logging.INFO)
+
+        stages = self.stages
+        ex_details = self._ex_stage.details
+        mem_details = self._mem_stage.details
+
+        self.write_back_stage_func(mem_details)
+        self.memory_stage_func(ex_details)
+
+        id_details = self._id_stage.details
+        ex_input = self._ex_input
+        ex_input_pcs = self._ex_input_pcs
+        d = id_details[0]
+        if d:
+            ex_input[0] = d.get(_DECODED_INSTRUCTION)
+            ex_input_pcs[0] = d.get(_PC_KEY)
+        else:
+            ex_input[0] = None
+            ex_input_pcs[0] = None
+        d = id_details[1]
+        if d:
+            ex_input[1] = d.get(_DECODED_INSTRUCTION)
+            ex_input_pcs[1] = d.get(_PC_KEY)
+        else:
+            ex_input[1] = None
+            ex_input_pcs[1] = None
+        self.execute_stage(ex_input)
+        decoded_instructions = self.decode_stage(self._if_stage.details)
+
+        in_flight_dst_mask = 0
+        data = ex_details[0]
+        if data and _DECODED in data:
+            in_flight_dst_mask |= data[_DECODED].dst_mask
+        data = ex_details[1]
+        if data and _DECODED in data:
+            in_flight_dst_mask |= data[_DECODED].dst_mask
+        data = mem_details[0]
+        if data and _DECODED in data:
+            in_flight_dst_mask |= data[_DECODED].dst_mask
+        data = mem_details[1]
+        if data and _DECODED in data:
+            in_flight_dst_mask |= data[_DECODED].dst_mask
+        self.in_flight_dst_mask = in_flight_dst_mask
+
+        if self.detect_data_hazard(decoded_instructions):
+            if log_enabled:
+                logger.info("\n---- Cycle %d ----\nData hazard detected. Stalling pipeline.", self.cycle_count)
+            self.flush_pipeline()
+            stall_info = "STALL: Inserted bubble (NOP)"
+        else:
+            self.fetch_stage()
+            stall_info = "NO STALL"
 
-        pipeline_details = [
-            f"{name}: {', '.join([hex(instr) if isinstance(instr, int) else (instr if instr else Instruction.NOP.value) for instr in stage.instructions])}"
-            for name, stage in self.stages.items()
+        self.forwarding[_MEM_WB] = self.forwarding[_EX_MEM]
+        self.forwarding[_EX_MEM] = [
+            None if not data else {
+                _RD_KEY: data[_DECODED].rd or data[_DECODED].rt,
+                'value': data.get(_ALU_RESULT)
+            } for data in ex_details
         ]
-        logger.info(f"{cycle_info}\n{' | '.join(pipeline_details)} | {stall_info}")
-        self.print_clock_cycle()
+        self.forwarding_by_reg = {
+            fwd[_RD_KEY]: fwd['value']
+            for fwd in self.forwarding[_MEM_WB] + self.forwarding[_EX_MEM]
+            if fwd and fwd[_RD_KEY]
+        }
+
+        if log_enabled:
+            pipeline_details = [
+                f"{name}: {', '.join([hx(instr) if isinstance(instr, int) else (instr if instr else Instruction.NOP.value) for instr in stage.instructions])}"
+                for name, stage in stages.items()
+            ]
+            logger.info("\n---- Cycle %d ----\n%s | %s", self.cycle_count, ' | '.join(pipeline_details), stall_info)
+            self.print_clock_cycle()
 
     def print_clock_cycle(self):
-        logger.info(f"Clock Cycle: {self.cycle_count}")
+        logger.info("Clock Cycle: %d", self.cycle_count)
 
     def get_cycle_info(self) -> dict:
         stages_info = {}
         for name, stage in self.stages.items():
-            stages_info[name] = stage.instructions
+            # Copy: the slot buffers are reused in place each cycle, but the
+            # report generator keeps these snapshots across cycles
+            stages_info[name] = list(stage.instructions)
         
         return {
             'stages': stages_info,
-            'registers': {i: val for i, val in enumerate(self.registers)},
-            'hazards': {'data_hazards': self.detect_data_hazard([d.get(RegisterTypes.decoded_instruction.value) if d else None for d in self.stages[Stages.ID.value].details])}
+            # dict(enumerate(...)) snapshots the register file in one C-level
+            # pass instead of a Python-level loop per register
+            'registers': dict(enumerate(self.registers)),
+            'hazards': {'data_hazards': self.detect_data_hazard([d.get(_DECODED_INSTRUCTION) if d else None for d in self._id_stage.details])}
         }
 
-    def simulate(self, program: List[int], max_cycles: int = 100, report_generator=None):
+    def simulate(self, program: Sequence[int], max_cycles: int = 100, report_generator=None):
         """
         Run the pipeline simulation with the given program.
-        
+
         Args:
-            program: List of instructions encoded as integers
+            program: Sequence of instructions encoded as integers
             max_cycles: Maximum number of cycles to simulate
             report_generator: Optional SimulationReportGenerator instance
         """
-        self.program = program
+        # Store as a tuple: immutable, cheaper to index, and safe to share
+        # between runs
+        self.program = tuple(program)
+        # The program is immutable, so decode each instruction exactly once up
+        # front; the pipeline stages then pass around references to these
+        # records. Each one is also bound directly to its execute handler here.
+        self.decoded_program = [decode(instr) for instr in program]
+        for decoded in self.decoded_program:
+            condition = BRANCH_CONDITIONS_BY_OP.get(decoded.op)
+            if condition is not None:
+                decoded.execute = _bind_branch(condition, decoded.immediate)
+            else:
+                decoded.execute = EXECUTE_BY_OP[decoded.op]
+        # Per-PC detail dicts for the front end, built once alongside the
+        # decoded table so fetch/decode never allocate dicts inside the loop
+        self.fetch_details_by_pc = [
+            {
+                _PC_KEY: pc,
+                _RAW_KEY: hx(instr),
+                _DECODED_INSTRUCTION: self.decoded_program[pc]
+            }
+            for pc, instr in enumerate(self.program)
+        ]
         if report_generator:
             report_generator.add_program_info(program)
             
         logger.info("====== Risk -V : MIPS Superscalar Pipeline Simulation Started =====")
-        while self.pc < len(self.program) or any(any(instr is not None for instr in stage.instructions) for stage in self.stages.values()):
+        program_len = len(self.program)
+        # The in-flight counter covers the front end (IF/ID); the back-end
+        # stages are scanned directly since executed bundles can outlive a
+        # flush and still need to drain through MEM/WB
+        back_end = (self._ex_stage, self._mem_stage, self._wb_stage)
+        while (self.pc < program_len or self.active_instructions > 0
+               or any(instr is not None for stage in back_end for instr in stage.instructions)):
             if self.cycle_count >= max_cycles:
                 logger.warning("Maximum cycle count reached.")
                 break
@@ -366,17 +817,28 @@ class ComprehensivePipelineProcessor:
                     cycle_info['hazards']
                 )
         
+        # Guard the end-of-run summaries too: rendering the full report (or
+        # the register dump) is pure string building that is wasted when INFO
+        # output is filtered, e.g. in batch runs
         if report_generator:
-            logger.info("\n" + report_generator.generate_report())
-        else:
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("\n%s", report_generator.generate_report())
+        elif logger.isEnabledFor(logging.INFO):
             logger.info("=== Superscalar Pipeline Simulation Ended ===")
             self.print_registers()
-            logger.info(f"Total Cycles: {self.cycle_count}")
+            logger.info("Total Cycles: %d", self.cycle_count)
+            resolved = self.branch_hits + self.branch_misses
+            if resolved:
+                logger.info("Branch Prediction: %d/%d correct (%.1f%%)",
+                            self.branch_hits, resolved,
+                            100.0 * self.branch_hits / resolved)
 
     def print_registers(self):
-        logger.info("\nFinal Register States:")
-        for i in range(len(self.registers)):
-            logger.info(f"${i}: {self.registers[i]}")
+        # One formatted message instead of a logger call per register: each
+        # call runs the full handler/formatting machinery
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("\nFinal Register States:\n%s",
+                        '\n'.join(f"${i}: {value}" for i, value in enumerate(self.registers)))
 
     def store_word(self, address, value):
         """Store a word in memory"""
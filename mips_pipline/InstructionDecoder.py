@@ -1,48 +1,207 @@
-from mips_pipline.enums.ProcessorSignals import Stages, InstructionTypes, RegisterTypes, Instruction
+import ctypes
+
+from mips_pipline.enums.ProcessorSignals import Stages, InstructionTypes, RegisterTypes, Instruction, OP_BY_MNEMONIC
+
+
+class _MipsFields(ctypes.LittleEndianStructure):
+    """Bitfield view of a 32-bit MIPS instruction word (LSB first)."""
+    _fields_ = [
+        ('funct', ctypes.c_uint32, 6),
+        ('shamt', ctypes.c_uint32, 5),
+        ('rd', ctypes.c_uint32, 5),
+        ('rt', ctypes.c_uint32, 5),
+        ('rs', ctypes.c_uint32, 5),
+        ('opcode', ctypes.c_uint32, 6),
+    ]
+
+
+class _MipsInst(ctypes.Union):
+    """Union of the raw instruction word and its bitfield view, so field
+    extraction happens at the C level instead of Python shift/mask bytecode."""
+    _fields_ = [('fields', _MipsFields), ('value', ctypes.c_uint32)]
+
+
+# Shared scratch instance: decode() is single-threaded and copies the fields
+# out immediately, so one union can be reused for every instruction
+_INST = _MipsInst()
+
+# Decoded records memoized by raw instruction word: the same word appearing
+# at several PCs (or across simulate() runs) is decoded only once. Records
+# are read-only downstream, so sharing them is safe.
+_DECODE_CACHE = {}
+
+# Tiny direct-mapped cache in front of the dict: 16 entries indexed by the
+# low bits of the word, checked with one list index and one compare before
+# paying for a dict hash. Programs reuse a handful of words, so most repeat
+# decodes hit here.
+_L0_SIZE = 16
+_L0_TAGS = [-1] * _L0_SIZE
+_L0_VALS = [None] * _L0_SIZE
+
+# Enum payloads bound once: decode misses compare instruction types per
+# word, and each .value read on an Enum member routes through a descriptor
+_R_TYPE = InstructionTypes.R.value
+_I_TYPE = InstructionTypes.I.value
+_J_TYPE = InstructionTypes.J.value
+
+# I-type instructions that read rt as a second source operand
+_SRC_RT_MNEMONICS = frozenset((
+    Instruction.BEQ.value, Instruction.BNE.value, Instruction.SW.value,
+))
+
+# I-type instructions that write their result to rt
+_DST_RT_MNEMONICS = frozenset((
+    Instruction.ADDI.value, Instruction.ORI.value, Instruction.XORI.value,
+    Instruction.LW.value,
+))
+
+# Field-to-mnemonic maps, built once at module scope instead of inside
+# every get_instruction_name call
+_R_TYPE_MAP = {
+    0x20: Instruction.ADD.value,
+    0x22: Instruction.SUB.value,
+    0x24: Instruction.AND.value,
+    0x25: Instruction.OR.value,
+    0x27: Instruction.NOR.value,
+    0x2A: Instruction.SLT.value,
+    0x26: Instruction.XOR.value,
+    0x2B: Instruction.SGT.value,
+    0x00: Instruction.SLL.value,
+    0x02: Instruction.SRL.value,
+}
+
+_I_TYPE_MAP = {
+    0x23: Instruction.LW.value,
+    0x2B: Instruction.SW.value,
+    0x0D: Instruction.ORI.value,
+    0x0E: Instruction.XORI.value,
+    0x01: Instruction.BLTZ_BGEZ.value,
+    0x04: Instruction.BEQ.value,
+    0x05: Instruction.BNE.value,
+    0x08: Instruction.ADDI.value,
+}
+
+_J_TYPE_MAP = {
+    0x02: Instruction.J.value,
+    0x03: Instruction.JAL.value,
+}
+
+class DecodedInstruction:
+    """
+    Lightweight record for one decoded instruction. __slots__ avoids the
+    per-instance dict, so the record is several times smaller than the dict
+    it replaces and attribute reads resolve through a fixed slot index.
+    """
+
+    __slots__ = ('opcode', 'rs', 'rt', 'rd', 'shamt', 'funct', 'immediate',
+                 'address', 'type', 'mnemonic', 'op', 'src_regs', 'dst_reg',
+                 'src_mask', 'dst_mask', 'execute')
+
+    def __init__(self, opcode, rs, rt, rd, shamt, funct, immediate, address,
+                 instr_type, mnemonic, op, src_regs, dst_reg):
+        self.opcode = opcode
+        self.rs = rs
+        self.rt = rt
+        self.rd = rd
+        self.shamt = shamt
+        self.funct = funct
+        self.immediate = immediate
+        self.address = address
+        self.type = instr_type
+        self.mnemonic = mnemonic
+        self.op = op
+        self.src_regs = src_regs
+        self.dst_reg = dst_reg
+        # Register bitmasks for hazard detection: bit r is set if register r
+        # is read/written. The destination mask drops $0 (bit 0) so writes to
+        # the hardwired zero register never register as hazards.
+        src_mask = 0
+        for reg in src_regs:
+            src_mask |= 1 << reg
+        self.src_mask = src_mask
+        self.dst_mask = (1 << dst_reg) & ~1
+        # Bound by the processor once the program is loaded
+        self.execute = None
+
+    def __repr__(self):
+        return f"DecodedInstruction({self.mnemonic})"
+
+
+def decode(instruction: int) -> DecodedInstruction:
+    """
+    Decodes a 32-bit MIPS instruction into its components.
+
+    Module-level so callers skip the class attribute walk and descriptor
+    binding of the old static method.
+
+    Args:
+        instruction (int): 32-bit MIPS instruction
+
+    Returns:
+        DecodedInstruction: Record of decoded instruction fields and metadata
+    """
+    l0_idx = instruction & (_L0_SIZE - 1)
+    if _L0_TAGS[l0_idx] == instruction:
+        return _L0_VALS[l0_idx]
+
+    cached = _DECODE_CACHE.get(instruction)
+    if cached is not None:
+        _L0_TAGS[l0_idx] = instruction
+        _L0_VALS[l0_idx] = cached
+        return cached
+
+    # Extract instruction fields through the C-level bitfield view
+    _INST.value = instruction
+    fields = _INST.fields
+    opcode = fields.opcode
+    rs = fields.rs
+    rt = fields.rt
+    rd = fields.rd
+    shamt = fields.shamt
+    funct = fields.funct
+    address = instruction & 0x3FFFFFF
+
+    # Branchless sign extension of the 16-bit immediate
+    imm = ((instruction & 0xFFFF) ^ 0x8000) - 0x8000
+
+    # Single flat-table lookup resolves type and mnemonic together
+    instr_type, mnemonic = _DECODE_TABLE[(opcode << 6) | funct]
+
+    # The REGIMM family (opcode 0x01) encodes BLTZ vs BGEZ in the rt field;
+    # resolving it here, once per unique word, means the execute stage
+    # dispatches on a distinct mnemonic with no per-cycle discrimination
+    if opcode == 0x01:
+        mnemonic = Instruction.BLTZ.value if rt == 0 else Instruction.BGEZ.value
+
+    # Precompute hazard metadata so detection never re-dispatches on
+    # type/mnemonic per cycle
+    if instr_type == _R_TYPE:
+        src_regs = (rs, rt)
+        dst_reg = rd
+    elif instr_type == _I_TYPE:
+        src_regs = (rs, rt) if mnemonic in _SRC_RT_MNEMONICS else (rs,)
+        dst_reg = rt if mnemonic in _DST_RT_MNEMONICS else 0
+    else:
+        src_regs = ()
+        dst_reg = 0
+
+    decoded = DecodedInstruction(opcode, rs, rt, rd, shamt, funct, imm,
+                                 address, instr_type, mnemonic,
+                                 OP_BY_MNEMONIC[mnemonic], src_regs, dst_reg)
+    _DECODE_CACHE[instruction] = decoded
+    _L0_TAGS[l0_idx] = instruction
+    _L0_VALS[l0_idx] = decoded
+    return decoded
+
 
 class InstructionDecoder:
     """
     Handles the decoding of MIPS instructions by extracting and interpreting their components.
     Provides static methods to decode instruction bits and identify instruction types and names.
     """
-    
-    @staticmethod
-    def decode(instruction: int) -> dict:
-        """
-        Decodes a 32-bit MIPS instruction into its components.
-        
-        Args:
-            instruction (int): 32-bit MIPS instruction
-            
-        Returns:
-            dict: Dictionary containing decoded instruction fields and metadata
-        """
-        # Extract instruction fields
-        opcode = (instruction >> 26) & 0x3F
-        rs = (instruction >> 21) & 0x1F
-        rt = (instruction >> 16) & 0x1F
-        rd = (instruction >> 11) & 0x1F
-        shamt = (instruction >> 6) & 0x1F
-        funct = instruction & 0x3F
-        imm = instruction & 0xFFFF
-        address = instruction & 0x3FFFFFF
-
-        # Sign extension for immediate value
-        if imm & 0x8000:  
-            imm = imm - 0x10000
-
-        return {
-            RegisterTypes.opcode.value: opcode,
-            RegisterTypes.rs.value: rs,
-            RegisterTypes.rt.value: rt,
-            RegisterTypes.rd.value: rd,
-            RegisterTypes.shamt.value: shamt,
-            RegisterTypes.funct.value: funct,
-            RegisterTypes.immediate.value: imm,
-            RegisterTypes.address.value: address,
-            RegisterTypes.type.value: InstructionDecoder.get_instruction_type(opcode, funct),
-            RegisterTypes.mnemonic.value: InstructionDecoder.get_instruction_name(opcode, funct)
-        }
+
+    # Kept for existing callers; the implementation lives at module level
+    decode = staticmethod(decode)
 
     @staticmethod
     def get_instruction_type(opcode: int, funct: int) -> str:
@@ -57,11 +216,11 @@ class InstructionDecoder:
             str: Instruction type as defined in InstructionTypes
         """
         if opcode == 0:
-            return InstructionTypes.R.value
+            return _R_TYPE
         elif opcode in [0x02, 0x03]:
-            return InstructionTypes.J.value
+            return _J_TYPE
         else:
-            return InstructionTypes.I.value
+            return _I_TYPE
 
     @staticmethod
     def get_instruction_name(opcode: int, funct: int) -> str:
@@ -75,44 +234,22 @@ class InstructionDecoder:
         Returns:
             str: Instruction mnemonic as defined in Instruction enum
         """
-        # R-type instruction mapping
-        r_type_map = {
-            0x20: Instruction.ADD.value,
-            0x22: Instruction.SUB.value,
-            0x24: Instruction.AND.value,
-            0x25: Instruction.OR.value,
-            0x27: Instruction.NOR.value,
-            0x2A: Instruction.SLT.value,
-            0x26: Instruction.XOR.value,
-            0x2B: Instruction.SGT.value,
-            0x00: Instruction.SLL.value,
-            0x02: Instruction.SRL.value,
-        }
-
-        # I-type instruction mapping
-        i_type_map = {
-            0x23: Instruction.LW.value,
-            0x2B: Instruction.SW.value,
-            0x0D: Instruction.ORI.value,
-            0x0E: Instruction.XORI.value,
-            0x01: Instruction.BLTZ_BGEZ.value,
-            0x04: Instruction.BEQ.value,
-            0x05: Instruction.BNE.value,
-            0x08: Instruction.ADDI.value,
-        }
-
-        # J-type instruction mapping
-        j_type_map = {
-            0x02: Instruction.J.value,
-            0x03: Instruction.JAL.value
-        }
-
         # Determine instruction type and return corresponding mnemonic
         if opcode == 0:
-            return r_type_map.get(funct, Instruction.UNKNOWN.value)
-        elif opcode in j_type_map:
-            return j_type_map[opcode]
+            return _R_TYPE_MAP.get(funct, Instruction.UNKNOWN.value)
+        elif opcode in _J_TYPE_MAP:
+            return _J_TYPE_MAP[opcode]
         elif opcode == 0x01:
             return Instruction.BLTZ.value if funct == 0 else Instruction.BGEZ.value
         else:
-            return i_type_map.get(opcode, Instruction.UNKNOWN.value)
\ No newline at end of file
+            return _I_TYPE_MAP.get(opcode, Instruction.UNKNOWN.value)
+
+
+# Flat decode table indexed by (opcode << 6) | funct, built once at import
+# time from the classification methods above. Collapses the two per-decode
+# static-method calls into a single list index.
+_DECODE_TABLE = [
+    (InstructionDecoder.get_instruction_type(opcode, funct),
+     InstructionDecoder.get_instruction_name(opcode, funct))
+    for opcode in range(64) for funct in range(64)
+]
\ No newline at end of file
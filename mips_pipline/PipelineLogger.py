@@ -1,142 +1,204 @@
 # Standard library imports
 import logging
+from functools import lru_cache
 from typing import Dict, List
 
-# Third-party imports
-from prettytable import PrettyTable
-
 # Local imports
 from mips_pipline.enums.ProcessorSignals import RegisterTypes, Stages, Instruction
 
+# Cycle separator rule, built once instead of per header
+_SEP = "=" * 50
+
+# Enum payloads bound once at import: each .value read on an Enum member
+# goes through the DynamicClassAttribute descriptor, which is pure overhead
+# inside the per-cycle formatting loops below
+_RD = RegisterTypes.rd.value
+_NOP = Instruction.NOP.value
+
+# Stage detail keys worth printing, in display order. The detail dicts carry
+# a fixed key set, so walking this tuple replaces the per-dict items() scan
+# and its "skip the decoded record" filter with direct lookups.
+_PRINTABLE_KEYS = (
+    RegisterTypes.program_counter.value,
+    RegisterTypes.raw_instruction.value,
+    RegisterTypes.decoded_instruction.value,
+    RegisterTypes.alu_result.value,
+    RegisterTypes.mem_result.value,
+    RegisterTypes.branch_taken.value,
+    RegisterTypes.jump_address.value,
+)
+
+# Register grouping definitions, frozen at module scope: the per-cycle
+# register dump iterates these instead of rebuilding the dict (and its 24
+# name tuples) on every call
+_REGISTER_GROUPS = (
+    ("Zero", (("$zero", 0),)),
+    ("Function Arguments", tuple(("$a" + str(i), i + 4) for i in range(4))),
+    ("Function Results", tuple(("$v" + str(i), i + 2) for i in range(2))),
+    ("Temporaries", tuple(("$t" + str(i), i + 8) for i in range(10))),
+    ("Saved Temporaries", tuple(("$s" + str(i), i + 16) for i in range(8))),
+    ("Special Purpose", (
+        ("$gp", 28),  # Global Pointer
+        ("$sp", 29),  # Stack Pointer
+        ("$fp", 30),  # Frame Pointer
+        ("$ra", 31),  # Return Address
+    )),
+)
+
+# Pre-bound format methods: reusing the bound method skips re-parsing the
+# format spec on every cell
+_HEX_FMT = "0x{:08x}".format
+
+
+@lru_cache(maxsize=4096)
+def fmt_instr(instr) -> str:
+    """Render one pipeline slot, with empty slots shown as NOP.
+
+    Cached because the same instruction sits in a stage across cycles
+    (stalls especially), so repeat renderings are a dict hit.
+    """
+    return str(instr) if instr else _NOP
+
 class PipelineLogger:
     """
     A logging utility class for MIPS pipeline simulation that provides formatted output
     for pipeline states, register values, and execution statistics.
     """
 
+    __slots__ = ('logger',)
+
     def __init__(self):
         """Initialize the logger instance."""
         self.logger = logging.getLogger(__name__)
 
+    @staticmethod
+    def _render_table(headers: List[str], rows: List[List[str]]) -> str:
+        """
+        Render a grid table with left-aligned, padded cells.
+
+        Computes the column widths in one pass and pads with str.ljust,
+        which keeps per-cycle table rendering to plain string operations.
+        Cells may contain newlines; such rows span several physical lines.
+        """
+        # Split cells on newlines up front so widths account for each line
+        split_rows = [[cell.split("\n") for cell in row] for row in rows]
+        widths = [len(header) for header in headers]
+        for row in split_rows:
+            for i, cell_lines in enumerate(row):
+                for line in cell_lines:
+                    if len(line) > widths[i]:
+                        widths[i] = len(line)
+
+        separator = "+" + "+".join("-" * (width + 2) for width in widths) + "+"
+        lines = [separator,
+                 "| " + " | ".join(header.ljust(width) for header, width in zip(headers, widths)) + " |",
+                 separator]
+        for row in split_rows:
+            height = max(len(cell_lines) for cell_lines in row)
+            for line_num in range(height):
+                lines.append("| " + " | ".join(
+                    (cell_lines[line_num] if line_num < len(cell_lines) else "").ljust(width)
+                    for cell_lines, width in zip(row, widths)) + " |")
+        lines.append(separator)
+        return "\n".join(lines)
+
     def print_cycle_header(self, cycle_num: int):
         """Print a formatted header for each simulation cycle."""
-        self.logger.info("\n" + "="*50)
-        self.logger.info(f"CYCLE {cycle_num}")
-        self.logger.info("="*50)
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        self.logger.info("\n%s\nCYCLE %d\n%s", _SEP, cycle_num, _SEP)
 
     def print_pipeline_stages(self, stages: Dict):
         """
         Display the current state of pipeline stages in a tabular format.
         Shows instructions in each slot for every stage.
         """
-        table = PrettyTable()
-        table.field_names = ["Stage", "Slot 0", "Slot 1"]
-        table.align = "l"
-        
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        rows = []
         for stage_name, stage in stages.items():
-            instr_slots = [
-                str(instr) if instr else Instruction.NOP.value 
-                for instr in stage.instructions
-            ]
-            table.add_row([stage_name, instr_slots[0], instr_slots[1]])
-            
-        self.logger.info("\nPipeline State:")
-        self.logger.info(table)
+            instr_slots = [fmt_instr(instr) for instr in stage.instructions]
+            rows.append([stage_name, instr_slots[0], instr_slots[1]])
+
+        self.logger.info("\nPipeline State:\n%s",
+                         self._render_table(["Stage", "Slot 0", "Slot 1"], rows))
 
     def print_stage_details(self, stage_details: Dict):
         """
         Print detailed information about each pipeline stage's current state
         and operations being performed.
         """
-        table = PrettyTable()
-        table.field_names = ["Stage", "Details"]
-        table.align = "l"
-        
-        for stage_name, details in stage_details.items():
-            formatted_details = self._format_stage_details(details)
-            table.add_row([stage_name, formatted_details])
-            
-        self.logger.info("\nStage Details:")
-        self.logger.info(table)
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        rows = [
+            [stage_name, self._format_stage_details(details)]
+            for stage_name, details in stage_details.items()
+        ]
+
+        self.logger.info("\nStage Details:\n%s",
+                         self._render_table(["Stage", "Details"], rows))
 
     def print_register_state(self, registers: List[int]):
         """
         Display the current state of MIPS registers, grouped by their functional
         categories (e.g., arguments, temporaries, etc.).
         """
-        # Register grouping definitions
-        register_groups = {
-            "Zero": [("$zero", 0)],
-            "Function Arguments": [("$a"+str(i), i+4) for i in range(4)],
-            "Function Results": [("$v"+str(i), i+2) for i in range(2)],
-            "Temporaries": [("$t"+str(i), i+8) for i in range(10)],
-            "Saved Temporaries": [("$s"+str(i), i+16) for i in range(8)],
-            "Special Purpose": [
-                ("$gp", 28),  # Global Pointer
-                ("$sp", 29),  # Stack Pointer
-                ("$fp", 30),  # Frame Pointer
-                ("$ra", 31)   # Return Address
-            ]
-        }
-
-        # Create and format register state table
-        table = PrettyTable()
-        table.field_names = ["Group", "Register", "Number", "Value (Hex)", "Value (Dec)"]
-        table.align = "l"
-        
-        for group_name, regs in register_groups.items():
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        rows = []
+        for group_name, regs in _REGISTER_GROUPS:
+            # Tracked while adding rows so the separator decision below does
+            # not rescan the group's registers
+            group_had_nonzero = False
             for reg_name, reg_num in regs:
                 value = registers[reg_num]
+                if value != 0:
+                    group_had_nonzero = True
                 if reg_num == 0 or value != 0:  # Show $zero and non-zero registers
-                    table.add_row([
+                    rows.append([
                         group_name,
                         reg_name,
                         f"${reg_num}",
-                        f"0x{value:08x}",
+                        _HEX_FMT(value),
                         str(value)
                     ])
             # Add visual separator between groups
-            if any(registers[reg_num] != 0 for _, reg_num in regs):
-                table.add_row(["-"*15, "-"*10, "-"*5, "-"*10, "-"*10])
+            if group_had_nonzero:
+                rows.append(["-"*15, "-"*10, "-"*5, "-"*10, "-"*10])
 
-        self.logger.info("\nRegister State:")
-        self.logger.info(table)
+        self.logger.info("\nRegister State:\n%s", self._render_table(
+            ["Group", "Register", "Number", "Value (Hex)", "Value (Dec)"], rows))
 
     def print_hazard_info(self, hazard_detected: bool, forwarding_info: Dict):
         """
         Display information about detected hazards and data forwarding operations
         in the pipeline.
         """
-        table = PrettyTable()
-        table.field_names = ["Type", "Status"]
-        table.align = "l"
-        
-        table.add_row(["Hazard", "Detected - Pipeline Stalled" if hazard_detected else "None"])
-        
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        rows = [["Hazard", "Detected - Pipeline Stalled" if hazard_detected else "None"]]
+
         forwarding_status = []
         for stage, forwards in forwarding_info.items():
             for fwd in forwards:
                 if fwd:
                     forwarding_status.append(
-                        f"{stage}: R{fwd.get(RegisterTypes.rd.value)} = {fwd.get('value')}"
+                        f"{stage}: R{fwd.get(_RD)} = {fwd.get('value')}"
                     )
-        
-        table.add_row(["Forwarding", "\n".join(forwarding_status) if forwarding_status else "None"])
-        
-        self.logger.info("\nHazard and Forwarding Information:")
-        self.logger.info(table)
+
+        rows.append(["Forwarding", "\n".join(forwarding_status) if forwarding_status else "None"])
+
+        self.logger.info("\nHazard and Forwarding Information:\n%s",
+                         self._render_table(["Type", "Status"], rows))
 
     def print_statistics(self, stats: Dict):
         """Display final simulation statistics in a tabular format."""
-        table = PrettyTable()
-        table.field_names = ["Metric", "Value"]
-        table.align = "l"
-        
-        for metric, value in stats.items():
-            table.add_row([metric, value])
-            
-        self.logger.info("\nSimulation Statistics:")
-        self.logger.info(table)
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        rows = [[metric, str(value)] for metric, value in stats.items()]
+
+        self.logger.info("\nSimulation Statistics:\n%s",
+                         self._render_table(["Metric", "Value"], rows))
 
     def _format_stage_details(self, details: List[Dict]) -> str:
         """
@@ -147,7 +209,8 @@ class PipelineLogger:
         for slot_num, detail in enumerate(details):
             if detail:
                 formatted.append(f"Slot {slot_num}:")
-                for key, value in detail.items():
-                    if key != RegisterTypes.decoded.value:
+                for key in _PRINTABLE_KEYS:
+                    value = detail.get(key)
+                    if value is not None:
                         formatted.append(f"  {key}: {value}")
         return "\n".join(formatted) if formatted else "No details"
@@ -3,14 +3,22 @@ from typing import List, Dict, Optional
 class PipelineStage:
     """
     Represents a stage in a superscalar pipeline processor.
-    
+
     Attributes:
         name (str): Name identifier for the pipeline stage
-        instructions (List[Optional[int]]): List of instruction IDs currently in this stage
-        details (List[Dict]): Associated metadata for each instruction
+        instructions (List): Per-slot occupant: a raw instruction word (IF),
+            a mnemonic string (later stages), or None for a bubble
+        details (List[Optional[Dict]]): Per-slot stage record, or None for
+            a bubble; the decoded fields themselves live in the shared
+            DecodedInstruction records the dicts point at
         stalled (bool): Flag indicating if the stage is stalled
     """
-    
+
+    # The per-cycle loops read stage.instructions/stage.details hundreds of
+    # times; __slots__ turns those into fixed-offset loads and drops the
+    # per-instance attribute dict
+    __slots__ = ('name', 'instructions', 'details', 'stalled')
+
     def __init__(self, name: str, width: int = 2) -> None:
         """
         Initialize a new pipeline stage.
@@ -21,5 +29,8 @@ class PipelineStage:
         """
         self.name = name
         self.instructions: List[Optional[int]] = [None] * width
-        self.details: List[Dict] = [{}] * width
+        # None is the shared empty-slot marker throughout the pipeline; it
+        # is immutable, so slots can never alias each other's state the way
+        # a [{}] * width fill would
+        self.details: List[Optional[Dict]] = [None] * width
         self.stalled = False
@@ -1,10 +1,48 @@
+import io
 import logging
-from typing import Dict, List
+import pickle
+import tempfile
+from itertools import islice
+from typing import Dict, Iterator, List
 from tabulate import tabulate
 from datetime import datetime
 from fpdf import FPDF
+from fpdf.enums import XPos, YPos
+from fpdf.fonts import FontFace
 import os
 
+from mips_pipline.PipelineLogger import fmt_instr
+
+# Section rules, built once instead of per report
+_RULE_HEAVY = "=" * 80
+_RULE_LIGHT = "-" * 20
+
+# Stage column width for the per-cycle tables; covers the longest stage name
+_STAGE_W = 8
+
+
+def _render_cycle_table(stage_rows: List) -> str:
+    """Render one cycle's stage table with plain ljust padding.
+
+    tabulate re-measures every cell and rebuilds its rules on each call,
+    which made it the hot loop of text report generation (once per cycle).
+    The stage column is fixed width, so only the instruction column needs a
+    single max() pass — same approach as the logger's table renderer.
+    """
+    instr_w = len('Instructions')
+    for _, instr_str in stage_rows:
+        if len(instr_str) > instr_w:
+            instr_w = len(instr_str)
+
+    sep = "+" + "-" * (_STAGE_W + 2) + "+" + "-" * (instr_w + 2) + "+"
+    lines = [sep,
+             "| " + "Stage".ljust(_STAGE_W) + " | " + "Instructions".ljust(instr_w) + " |",
+             sep.replace("-", "=")]
+    for stage, instr_str in stage_rows:
+        lines.append("| " + stage.ljust(_STAGE_W) + " | " + instr_str.ljust(instr_w) + " |")
+        lines.append(sep)
+    return "\n".join(lines)
+
 class PDFReport(FPDF):
     def __init__(self):
         super().__init__()
@@ -14,15 +52,15 @@ class PDFReport(FPDF):
         self.light_gray = (245, 245, 245)
         self.dark_gray = (80, 80, 80)
         
-        # Try to use Montserrat if available, otherwise fall back to Arial
+        # Try to use Montserrat if available, otherwise fall back to Helvetica
         base_path = os.path.dirname(os.path.dirname(__file__))
         font_path = f'{base_path}/assets/fonts/Montserrat-Regular.ttf'
         try:
-            self.add_font('Montserrat', '', font_path, uni=True)
-            self.add_font('Montserrat', 'B', f'{base_path}/assets/fonts/Montserrat-Bold.ttf', uni=True)
+            self.add_font('Montserrat', '', font_path)
+            self.add_font('Montserrat', 'B', f'{base_path}/assets/fonts/Montserrat-Bold.ttf')
             self.default_font = 'Montserrat'
-        except RuntimeError:
-            self.default_font = 'Arial'
+        except (RuntimeError, FileNotFoundError):
+            self.default_font = 'Helvetica'
         
     def header(self):
         # Modern header design
@@ -32,213 +70,322 @@ class PDFReport(FPDF):
         # Title
         self.set_font(self.default_font, 'B', 24)
         self.set_text_color(255, 255, 255)
-        self.cell(0, 15, 'Risk - V Superscalar Simulation', 0, 1, 'C')
-        
+        self.cell(0, 15, 'Risk - V Superscalar Simulation', align='C',
+                  new_x=XPos.LMARGIN, new_y=YPos.NEXT)
+
         # Subtitle
         self.set_font(self.default_font, '', 12)
-        self.cell(0, 8, f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", 0, 1, 'C')
+        self.cell(0, 8, f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+                  align='C', new_x=XPos.LMARGIN, new_y=YPos.NEXT)
         self.ln(20)
 
     def footer(self):
         self.set_y(-15)
         self.set_font(self.default_font, '', 8)
         self.set_text_color(*self.dark_gray)
-        self.cell(0, 10, f'Page {self.page_no()}', 0, 0, 'C')
+        self.cell(0, 10, f'Page {self.page_no()}', align='C')
 
     def chapter_title(self, title):
         self.set_font(self.default_font, 'B', 16)
         self.set_fill_color(*self.secondary_color)
         self.set_text_color(255, 255, 255)
-        self.cell(0, 10, title, 0, 1, 'L', True)
+        self.cell(0, 10, title, align='L', fill=True,
+                  new_x=XPos.LMARGIN, new_y=YPos.NEXT)
         self.ln(5)
 
+    def dump_monospace_block(self, text):
+        """Emit a preformatted block with a single multi_cell call.
+
+        One font switch and one cell replaces the per-cell emit loop of
+        create_table, which pays font-metrics math for every cell.
+        """
+        self.set_text_color(*self.dark_gray)
+        self.set_font('Courier', '', 9)
+        self.multi_cell(0, 4, text)
+
     def create_table(self, headers, data, col_widths=None, data_font=None):
         if data_font is None:
             data_font = self.default_font
-        
-        self.set_fill_color(*self.light_gray)
+
+        # Stringify every cell once up front; the table widget then never
+        # re-stringifies the same value
+        str_rows = [[str(cell) for cell in row] for row in data]
+
         self.set_text_color(*self.dark_gray)
-        self.set_font(self.default_font, 'B', 10)
-        
-        # Headers
-        for i, header in enumerate(headers):
-            width = col_widths[i] if col_widths else self.get_string_width(header) + 10
-            self.cell(width, 8, header, 1, 0, 'C', True)
-        self.ln()
-        
-        # Data with subtle tint for alternate rows
         self.set_font(data_font, '', 10)
-        for i, row in enumerate(data):
-            self.set_fill_color(240, 248, 255) if i % 2 else self.set_fill_color(255, 255, 255)  # Alice Blue for alternate rows
-            for j, cell in enumerate(row):
-                width = col_widths[j] if col_widths else self.get_string_width(str(cell)) + 10
-                self.cell(width, 8, str(cell), 1, 0, 'L', True)
-            self.ln()
+
+        # fpdf2's table widget lays out the whole grid in one pass (widths
+        # are resolved once at flow time) instead of one cell() call per
+        # field; Alice Blue tint on alternate data rows as before
+        headings_style = FontFace(family=self.default_font, emphasis='BOLD',
+                                  fill_color=self.light_gray,
+                                  color=self.dark_gray)
+        with self.table(headings_style=headings_style,
+                        col_widths=col_widths or 'auto',
+                        line_height=8,
+                        text_align='LEFT',
+                        cell_fill_color=(240, 248, 255),
+                        cell_fill_mode='EVEN_ROWS') as table:
+            heading = table.row()
+            for header in headers:
+                heading.cell(header, align='CENTER')
+            for str_row in str_rows:
+                row = table.row()
+                for cell in str_row:
+                    row.cell(cell)
 
 class SimulationReportGenerator:
     def __init__(self):
         self.program_info = []
-        self.cycle_data = []
         self.start_time = datetime.now()
         self.pdf = PDFReport()
-        
+        # Cycle snapshots stream to an anonymous temp file as pickled
+        # records instead of accumulating in memory: long simulations would
+        # otherwise hold every cycle's stage/register state live. Only the
+        # cycle count and the latest register state stay resident.
+        self._wal = tempfile.TemporaryFile()
+        self._cycle_count = 0
+        self._last_registers: Dict = {}
+        self._last_stages: Dict = {}
+        # Rendered-cycle cache shared by the text and PDF paths; rebuilt
+        # lazily when the cycle log has grown since it was last computed
+        self._cycle_render: List = []
+        self._metrics_cache: Dict = {}
+
     def add_program_info(self, program: List[int]):
-        self.program_info = [hex(instr) for instr in program]
-        
+        # Keep the raw words; hex rendering is deferred to report emission,
+        # so loading a program costs no string building at all
+        self.program_info = tuple(program)
+
     def add_cycle_data(self, cycle: int, stages: Dict, registers: Dict, hazards: Dict):
-        self.cycle_data.append({
+        # Delta-encode against the previous cycle: most cycles change a
+        # register or two and advance a couple of pipeline slots, so only
+        # those entries are serialized. _iter_cycles replays the deltas back
+        # into full snapshots.
+        reg_delta = {reg: val for reg, val in registers.items()
+                     if self._last_registers.get(reg, 0) != val}
+        last_stages = self._last_stages
+        stage_delta = {name: instrs for name, instrs in stages.items()
+                       if last_stages.get(name) != instrs}
+        # Reposition at the end in case a report was generated mid-run
+        self._wal.seek(0, os.SEEK_END)
+        pickle.dump({
             'cycle': cycle,
-            'stages': stages,
-            'registers': registers,
+            'stages': stage_delta,
+            'registers': reg_delta,
             'hazards': hazards
-        })
-        
+        }, self._wal, protocol=pickle.HIGHEST_PROTOCOL)
+        self._cycle_count += 1
+        self._last_registers = registers
+        self._last_stages = stages
+
+    def _iter_cycles(self) -> Iterator[Dict]:
+        """Replay the cycle records from the on-disk log, oldest first.
+
+        Records are stored as deltas; the running state is accumulated here
+        so consumers still see full per-cycle snapshots.
+        """
+        self._wal.flush()
+        self._wal.seek(0)
+        stages: Dict = {}
+        registers: Dict = {}
+        try:
+            while True:
+                record = pickle.load(self._wal)
+                stages.update(record['stages'])
+                registers.update(record['registers'])
+                record['stages'] = dict(stages)
+                record['registers'] = dict(registers)
+                yield record
+        except EOFError:
+            return
+
+    def _rendered_cycles(self) -> List:
+        """Per-cycle render shared by generate_report and generate_pdf.
+
+        Each entry is (cycle, stage_rows, has_hazard, has_bubble) where
+        stage_rows is a list of (stage, joined instruction string) pairs.
+        Cached so a caller producing both the text and the PDF report pays
+        for the cycle-log replay and instruction formatting only once.
+        """
+        if len(self._cycle_render) != self._cycle_count:
+            self._cycle_render = [
+                (record['cycle'],
+                 [(stage, ', '.join(fmt_instr(i) for i in instructions))
+                  for stage, instructions in record['stages'].items()],
+                 bool(record['hazards']['data_hazards']),
+                 any(instr is None
+                     for instrs in record['stages'].values()
+                     for instr in instrs))
+                for record in self._iter_cycles()
+            ]
+        return self._cycle_render
+
+    def _metrics(self) -> Dict:
+        """Summary metrics shared by generate_report and generate_pdf.
+
+        Computed once per simulation length and cached, so producing both
+        reports (or the same report twice) never redoes the CPI/IPC math or
+        the hazard-stall tally.
+        """
+        if self._metrics_cache.get('total_cycles') != self._cycle_count:
+            total_cycles = self._cycle_count
+            total_instructions = len(self.program_info)
+            ipc = total_instructions / total_cycles
+            self._metrics_cache = {
+                'total_cycles': total_cycles,
+                'total_instructions': total_instructions,
+                'cpi': total_cycles / total_instructions,
+                'ipc': ipc,
+                # 2-way superscalar: theoretical max IPC is 2
+                'ideal_cycles': total_instructions / 2,
+                'efficiency': (ipc / 2) * 100,
+                'hazard_stalls': sum(
+                    1 for _, _, has_hazard, has_bubble in self._rendered_cycles()
+                    if has_hazard and has_bubble),
+            }
+        return self._metrics_cache
+
     def generate_report(self) -> str:
-        report = []
-        
+        # Fast path for empty runs (e.g. simulation aborted before the first
+        # cycle): nothing to replay and the CPI/IPC divisions would be by 0
+        if not self._cycle_count or not self.program_info:
+            return "No simulation data"
+
+        # Written into a single growing buffer instead of a line list plus a
+        # final join, so long cycle logs stream straight into the output
+        buf = io.StringIO()
+        write = buf.write
+
         # Header
-        report.append("=" * 80)
-        report.append("Risk- V : MIPS Superscalar Pipeline Simulation Report")
-        report.append(f"Generated: {self.start_time.strftime('%Y-%m-%d %H:%M:%S')}")
-        report.append("=" * 80 + "\n")
-        
+        write(_RULE_HEAVY + "\n")
+        write("Risk- V : MIPS Superscalar Pipeline Simulation Report\n")
+        write(f"Generated: {self.start_time.strftime('%Y-%m-%d %H:%M:%S')}\n")
+        write(_RULE_HEAVY + "\n\n")
+
         # Program Information
-        report.append("1. Program Information")
-        report.append("-" * 20)
-        report.append("Instructions:")
-        for i, instr in enumerate(self.program_info):
-            report.append(f"{i:4d}: {instr}")
-        report.append("")
-        
+        write("1. Program Information\n")
+        write(_RULE_LIGHT + "\n")
+        write("Instructions:\n")
+        # Single generator-to-join pass, no intermediate list of lines
+        write("\n".join(f"{i:4d}: 0x{instr:x}"
+                        for i, instr in enumerate(self.program_info)))
+        write("\n\n")
+
+        metrics = self._metrics()
+
         # Simulation Summary
-        report.append("2. Simulation Summary")
-        report.append("-" * 20)
-        report.append(f"Total Cycles: {len(self.cycle_data)}")
-        report.append(f"Instructions Executed: {len(self.program_info)}")
-        report.append(f"CPI: {len(self.cycle_data)/len(self.program_info):.2f}")
-        report.append("")
-        
+        write("2. Simulation Summary\n")
+        write(_RULE_LIGHT + "\n")
+        write(f"Total Cycles: {metrics['total_cycles']}\n")
+        write(f"Instructions Executed: {metrics['total_instructions']}\n")
+        write(f"CPI: {metrics['cpi']:.2f}\n")
+        write("\n")
+
         # Cycle-by-Cycle Analysis
-        report.append("3. Cycle-by-Cycle Analysis")
-        report.append("-" * 20)
-        for cycle_info in self.cycle_data:
-            report.append(f"\nCycle {cycle_info['cycle']}:")
-            
-            # Pipeline Stages
-            stage_data = []
-            for stage, instructions in cycle_info['stages'].items():
-                instr_str = ', '.join([str(i) if i else 'NOP' for i in instructions])
-                stage_data.append([stage, instr_str])
-            report.append(tabulate(stage_data, headers=['Stage', 'Instructions'], tablefmt='grid'))
-            
+        write("3. Cycle-by-Cycle Analysis\n")
+        write(_RULE_LIGHT + "\n")
+        for cycle, stage_rows, has_hazard, _ in self._rendered_cycles():
+            write(f"\nCycle {cycle}:\n")
+            write(_render_cycle_table(stage_rows))
+            write("\n")
+
             # Hazards
-            if cycle_info['hazards']['data_hazards']:
-                report.append("* Data Hazard Detected")
-        
+            if has_hazard:
+                write("* Data Hazard Detected\n")
+
         # Register State
-        report.append("\n4. Final Register State")
-        report.append("-" * 20)
-        final_registers = self.cycle_data[-1]['registers']
+        write("\n4. Final Register State\n")
+        write(_RULE_LIGHT + "\n")
+        final_registers = self._last_registers
         reg_data = [[f"R{i}", hex(val)] for i, val in final_registers.items()]
-        report.append(tabulate(reg_data, headers=['Register', 'Value'], tablefmt='grid'))
-        
+        write(tabulate(reg_data, headers=['Register', 'Value'], tablefmt='grid'))
+        write("\n")
+
         # Performance Metrics
-        report.append("\n5. Performance Metrics")
-        report.append("-" * 20)
-        # Count actual hazard stalls
-        hazard_cycles = 0
-        for i in range(len(self.cycle_data)):
-            if self.cycle_data[i]['hazards']['data_hazards']:
-                stages = self.cycle_data[i]['stages']
-                if any('NOP' in str(instr) for stage, instrs in stages.items() for instr in instrs):
-                    hazard_cycles += 1
-
-        total_instructions = len(self.program_info)
-        ideal_cycles = total_instructions / 2  # Due to 2-way superscalar
-        actual_cycles = len(self.cycle_data)
-        
-        theoretical_max_throughput = total_instructions
-        actual_throughput = total_instructions / actual_cycles
-        pipeline_efficiency = (actual_throughput / 2) * 100  # Divide by 2 for 2-way superscalar
-
-        report.append(f"Hazard Stalls: {hazard_cycles}")
-        report.append(f"Ideal Cycles (no hazards): {ideal_cycles:.1f}")
-        report.append(f"Actual Cycles: {actual_cycles}")
-        report.append(f"Pipeline Efficiency: {pipeline_efficiency:.2f}%")
-        report.append(f"Instructions Per Cycle (IPC): {actual_throughput:.2f}")
-        
-        return "\n".join(report)
+        write("\n5. Performance Metrics\n")
+        write(_RULE_LIGHT + "\n")
+        write(f"Hazard Stalls: {metrics['hazard_stalls']}\n")
+        write(f"Ideal Cycles (no hazards): {metrics['ideal_cycles']:.1f}\n")
+        write(f"Actual Cycles: {metrics['total_cycles']}\n")
+        write(f"Pipeline Efficiency: {metrics['efficiency']:.2f}%\n")
+        write(f"Instructions Per Cycle (IPC): {metrics['ipc']:.2f}")
+
+        return buf.getvalue()
 
     def generate_pdf(self, filename: str):
         """Generate a beautifully formatted PDF report"""
         self.pdf.add_page()
-        
+
+        # Empty runs get a one-line page instead of sections full of
+        # zero-division metrics
+        if not self._cycle_count or not self.program_info:
+            self.pdf.set_font(self.pdf.default_font, '', 12)
+            self.pdf.cell(0, 10, 'No simulation data', align='L',
+                          new_x=XPos.LMARGIN, new_y=YPos.NEXT)
+            self.pdf.output(filename)
+            return
+
         # Program Information Section
         self.pdf.chapter_title('1. Program Information')
         headers = ['Index', 'Instruction']
-        data = [[f"{i:04d}", instr] for i, instr in enumerate(self.program_info[:20])]
+        data = [[f"{i:04d}", f"0x{instr:x}"] for i, instr in enumerate(self.program_info[:20])]
         self.pdf.create_table(headers, data, [30, 160], data_font='Courier')  # Use Courier for instructions
         self.pdf.ln(10)
 
         # Performance Analysis Section
         self.pdf.chapter_title('2. Performance Analysis')
-        metrics = [
-            ['Total Cycles', str(len(self.cycle_data))],
-            ['Instructions', str(len(self.program_info))],
-            ['CPI', f"{len(self.cycle_data)/len(self.program_info):.2f}"],
-            ['Efficiency', f"{(len(self.program_info)/(len(self.cycle_data)*2))*100:.1f}%"]
+        metrics = self._metrics()
+        summary = [
+            ['Total Cycles', str(metrics['total_cycles'])],
+            ['Instructions', str(metrics['total_instructions'])],
+            ['CPI', f"{metrics['cpi']:.2f}"],
+            ['Efficiency', f"{metrics['efficiency']:.1f}%"]
         ]
-        self.pdf.create_table(['Metric', 'Value'], metrics, [95, 95])
+        self.pdf.create_table(['Metric', 'Value'], summary, [95, 95])
         self.pdf.ln(10)
 
         # Pipeline Analysis Section
         self.pdf.chapter_title('3. Pipeline Stages Analysis')
-        for i, cycle_info in enumerate(self.cycle_data[:15]):
+        for cycle, stage_rows, has_hazard, _ in islice(self._rendered_cycles(), 15):
             # Cycle header with modern styling
             self.pdf.set_fill_color(200, 220, 240)  # Light blue for cycle header
             self.pdf.set_font(self.pdf.default_font, 'B', 12)
-            self.pdf.cell(0, 8, f"Cycle {cycle_info['cycle']}", 0, 1, 'L', True)
+            self.pdf.cell(0, 8, f"Cycle {cycle}", align='L', fill=True,
+                          new_x=XPos.LMARGIN, new_y=YPos.NEXT)
             self.pdf.ln(2)
-            
-            # Stage information
-            stage_data = []
-            for stage, instructions in cycle_info['stages'].items():
-                instr_str = ', '.join([str(i) if i else 'NOP' for i in instructions])
-                stage_data.append([stage, instr_str])
-            self.pdf.create_table(['Stage', 'Instructions'], stage_data, [40, 150])
-            
+
+            # Stage information as one preformatted block: a single
+            # multi_cell instead of one fpdf cell per stage and slot
+            self.pdf.dump_monospace_block("\n".join(
+                f"{stage:<8} {instr_str}" for stage, instr_str in stage_rows))
+
             # Hazard warning with icon
-            if cycle_info['hazards']['data_hazards']:
+            if has_hazard:
                 self.pdf.set_text_color(200, 0, 0)
                 self.pdf.set_font(self.pdf.default_font, 'B', 10)
-                self.pdf.cell(0, 6, '⚠ Data Hazard Detected', 0, 1, 'L')
+                self.pdf.cell(0, 6, '⚠ Data Hazard Detected', align='L',
+                              new_x=XPos.LMARGIN, new_y=YPos.NEXT)
             self.pdf.ln(5)  # Increased spacing after each cycle
 
         # Final Register State Section
         self.pdf.chapter_title('4. Final Register State')
-        final_registers = self.cycle_data[-1]['registers']
+        final_registers = self._last_registers
         reg_data = [[f"R{i}", hex(val)] for i, val in final_registers.items()]
         self.pdf.create_table(['Register', 'Value'], reg_data, [95, 95], data_font='Courier')  # Use Courier for values
         self.pdf.ln(10)
 
         # Detailed Performance Metrics Section
         self.pdf.chapter_title('5. Detailed Performance Metrics')
-        total_cycles = len(self.cycle_data)
-        total_instructions = len(self.program_info)
-        cpi = total_cycles / total_instructions
-        ipc = total_instructions / total_cycles
-        hazard_stalls = sum(1 for cycle in self.cycle_data if cycle['hazards']['data_hazards'] and any('NOP' in str(instr) for stage in cycle['stages'].values() for instr in stage))
-        ideal_cycles = total_instructions / 2  # 2-way superscalar
-        pipeline_efficiency = (ipc / 2) * 100  # Theoretical max IPC is 2
-        metrics = [
-            ['Total Cycles', str(total_cycles)],
-            ['Total Instructions', str(total_instructions)],
-            ['Cycles Per Instruction (CPI)', f"{cpi:.2f}"],
-            ['Instructions Per Cycle (IPC)', f"{ipc:.2f}"],
-            ['Hazard Stalls', str(hazard_stalls)],
-            ['Ideal Cycles (no hazards)', f"{ideal_cycles:.1f}"],
-            ['Pipeline Efficiency', f"{pipeline_efficiency:.1f}%"]
+        detailed = [
+            ['Total Cycles', str(metrics['total_cycles'])],
+            ['Total Instructions', str(metrics['total_instructions'])],
+            ['Cycles Per Instruction (CPI)', f"{metrics['cpi']:.2f}"],
+            ['Instructions Per Cycle (IPC)', f"{metrics['ipc']:.2f}"],
+            ['Hazard Stalls', str(metrics['hazard_stalls'])],
+            ['Ideal Cycles (no hazards)', f"{metrics['ideal_cycles']:.1f}"],
+            ['Pipeline Efficiency', f"{metrics['efficiency']:.1f}%"]
         ]
-        self.pdf.create_table(['Metric', 'Value'], metrics, [120, 70])
+        self.pdf.create_table(['Metric', 'Value'], detailed, [120, 70])
         
         self.pdf.output(filename)
\ No newline at end of file
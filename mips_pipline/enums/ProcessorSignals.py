@@ -1,4 +1,5 @@
-from enum import Enum
+import sys
+from enum import Enum, IntEnum
 
 # Defines the three basic MIPS instruction formats
 class InstructionTypes(Enum):
@@ -26,6 +27,10 @@ class RegisterTypes (Enum):
     decoded_instruction = "decoded_instruction"
     raw_instruction = "raw_instruction"
     program_counter = "program_counter"
+    src_regs = "src_regs"
+    dst_reg = "dst_reg"
+    execute = "execute"
+    op = "op"
 
 # Represents the five pipeline stages in the MIPS processor
 class Stages(Enum):
@@ -78,3 +83,43 @@ class Instruction(Enum):
     NOP = "NOP"    # No Operation
     BLTZ_BGEZ = "BLTZ_BGEZ"  # Combined BLTZ/BGEZ instruction
     UNKNOWN = "UNKNOWN"       # Unknown/Invalid instruction
+
+# Small-integer ids for the instructions above, used by the hot pipeline
+# stages: comparing ints skips the hash-and-character-compare cost of the
+# mnemonic strings. Members mirror the Instruction enum one-to-one.
+class Op(IntEnum):
+    ADD = 0
+    SUB = 1
+    AND = 2
+    OR = 3
+    NOR = 4
+    XOR = 5
+    SLT = 6
+    SGT = 7
+    SLL = 8
+    SRL = 9
+    ADDI = 10
+    XORI = 11
+    ORI = 12
+    LW = 13
+    SW = 14
+    BNE = 15
+    BLTZ = 16
+    BGEZ = 17
+    BEQ = 18
+    JAL = 19
+    J = 20
+    NOP = 21
+    BLTZ_BGEZ = 22
+    UNKNOWN = 23
+
+# Intern the string payloads of the enums above: the values serve as dict
+# keys and comparison operands throughout the pipeline, and interning lets
+# those operations short-circuit on pointer identity before any character
+# compare.
+for _enum_cls in (InstructionTypes, RegisterTypes, Stages, Instruction):
+    for _member in _enum_cls:
+        _member._value_ = sys.intern(_member._value_)
+
+# Mnemonic string -> integer op id, for assigning ids at decode time
+OP_BY_MNEMONIC = {member.value: Op[member.name] for member in Instruction}